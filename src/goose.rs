@@ -1641,7 +1641,7 @@ impl GooseUser {
         // Parent is not defined when running
         // [`test_start`](../struct.GooseAttack.html#method.test_start),
         // [`test_stop`](../struct.GooseAttack.html#method.test_stop), and during testing.
-        if let Some(parent) = self.channel_to_parent.clone() {
+        if let Some(parent) = self.channel_to_parent.as_ref() {
             parent.send(GooseMetric::Request(request_metric))?;
         }
 
@@ -1874,7 +1874,7 @@ impl GooseUser {
             // Logger is not defined when running
             // [`test_start`](../struct.GooseAttack.html#method.test_start),
             // [`test_stop`](../struct.GooseAttack.html#method.test_stop), and during testing.
-            if let Some(logger) = self.logger.clone() {
+            if let Some(logger) = self.logger.as_ref() {
                 if self.config.no_debug_body {
                     logger.send(Some(GooseLog::Debug(GooseDebug::new(
                         tag, request, headers, None,
@@ -3429,8 +3429,7 @@ impl GooseAttack {
         goose_attack_run_state.all_users_spawned = false;
 
         // If enabled, spawn a logger thread.
-        let (logger_handle, all_threads_logger_tx) =
-            self.configuration.setup_loggers(&self.defaults).await?;
+        let (logger_handle, all_threads_logger_tx) = self.configuration.setup_loggers().await?;
         goose_attack_run_state.logger_handle = logger_handle;
         goose_attack_run_state.all_threads_logger_tx = all_threads_logger_tx;
 
@@ -132,6 +132,7 @@
 //! configuration option. The debug logger will still record any custom messages, details
 //! about the request (when available), and all server response headers (when available).
 
+use lazy_static::lazy_static;
 use regex::RegexSet;
 use serde::{Deserialize, Serialize};
 use serde_json::json;
@@ -166,16 +167,23 @@ pub enum GooseLogFormat {
     Json,
     Raw,
 }
+
+// Use a [`RegexSet`] to match string representations of `GooseLogFormat`. The set is compiled
+// once and reused each time `from_str` is invoked.
+lazy_static! {
+    static ref LOG_FORMAT: RegexSet =
+        RegexSet::new(&[r"(?i)^csv$", r"(?i)^(json|jsn)$", r"(?i)^raw$"])
+            .expect("failed to compile log_format RegexSet");
+}
+
 /// Allow setting log formats from the command line by impleenting [`FromStr`].
 impl FromStr for GooseLogFormat {
     type Err = GooseError;
 
     fn from_str(s: &str) -> Result<Self, Self::Err> {
-        // Use a [`RegexSet`] to match string representations of `GooseCoordinatedOmissionMitigation`,
-        // returning the appropriate enum value. Also match a wide range of abbreviations and synonyms.
-        let log_format = RegexSet::new(&[r"(?i)^csv$", r"(?i)^(json|jsn)$", r"(?i)^raw$"])
-            .expect("failed to compile log_format RegexSet");
-        let matches = log_format.matches(&s);
+        // Match string representations of `GooseLogFormat`, returning the appropriate enum
+        // value. Also match a wide range of abbreviations and synonyms.
+        let matches = LOG_FORMAT.matches(&s);
         if matches.matched(0) {
             Ok(GooseLogFormat::Csv)
         } else if matches.matched(1) {
@@ -444,18 +452,17 @@ impl GooseConfiguration {
     }
 
     /// Spawns the logger thread if one or more loggers are enabled.
+    ///
+    /// Loggers are configured once by [`configure_loggers`](#method.configure_loggers) when
+    /// the load test is initialized, so they are not reconfigured here.
     pub(crate) async fn setup_loggers(
-        &mut self,
-        defaults: &GooseDefaults,
+        &self,
     ) -> Result<(GooseLoggerJoinHandle, GooseLoggerTx), GooseError> {
         // If running in Manager mode, no logger thread is started.
         if self.manager {
             return Ok((None, None));
         }
 
-        // Update the logger configuration, loading defaults if necessasry.
-        self.configure_loggers(defaults);
-
         // If no longger is enabled, return immediately without launching logger thread.
         if self.debug_log.is_empty()
             && self.request_log.is_empty()
@@ -508,10 +515,13 @@ impl GooseConfiguration {
         log_file: &mut tokio::io::BufWriter<tokio::fs::File>,
         formatted_message: String,
     ) -> Result<(), ()> {
-        match log_file
-            .write(format!("{}\n", formatted_message).as_ref())
-            .await
-        {
+        // Write the message and trailing newline directly into the buffer, rather than first
+        // copying the (potentially large) message into a new newline-terminated string.
+        let result = match log_file.write_all(formatted_message.as_bytes()).await {
+            Ok(_) => log_file.write_all(b"\n").await,
+            Err(e) => Err(e),
+        };
+        match result {
             Ok(_) => (),
             Err(e) => {
                 warn!("failed to write to {}: {}", &self.debug_log, e);
@@ -527,9 +537,10 @@ impl GooseConfiguration {
         self: GooseConfiguration,
         receiver: flume::Receiver<Option<GooseLog>>,
     ) -> Result<(), GooseError> {
-        // If the debug_log is enabled, allocate a buffer and open the file.
-        let mut debug_log = self
-            .open_log_file(
+        // Open all enabled log files concurrently, allocating a buffer for each. Tokio performs
+        // file creation on its blocking thread pool, so this overlaps the filesystem latency.
+        let (mut debug_log, mut error_log, mut request_log, mut task_log) = tokio::join!(
+            self.open_log_file(
                 &self.debug_log,
                 "debug file",
                 if self.no_debug_body {
@@ -539,8 +550,12 @@ impl GooseConfiguration {
                     // Allocate a larger 8M buffer if logging response body.
                     8 * 1024 * 1024
                 },
-            )
-            .await;
+            ),
+            self.open_log_file(&self.error_log, "error log", 64 * 1024),
+            self.open_log_file(&self.request_log, "request log", 64 * 1024),
+            self.open_log_file(&self.task_log, "task log", 64 * 1024),
+        );
+
         // If the debug_log is a CSV, write the header.
         if self.debug_format == Some(GooseLogFormat::Csv) {
             if let Some(log_file) = debug_log.as_mut() {
@@ -549,11 +564,7 @@ impl GooseConfiguration {
             }
         }
 
-        // If the error_log is enabled, allocate a buffer and open the file.
-        let mut error_log = self
-            .open_log_file(&self.error_log, "error log", 64 * 1024)
-            .await;
-        // If the request_log is a CSV, write the header.
+        // If the error_log is a CSV, write the header.
         if self.error_format == Some(GooseLogFormat::Csv) {
             if let Some(log_file) = error_log.as_mut() {
                 // @TODO: error handling when writing to log fails.
@@ -561,10 +572,6 @@ impl GooseConfiguration {
             }
         }
 
-        // If the request_log is enabled, allocate a buffer and open the file.
-        let mut request_log = self
-            .open_log_file(&self.request_log, "request log", 64 * 1024)
-            .await;
         // If the request_log is a CSV, write the header.
         if self.request_format == Some(GooseLogFormat::Csv) {
             if let Some(log_file) = request_log.as_mut() {
@@ -575,10 +582,6 @@ impl GooseConfiguration {
             }
         }
 
-        // If the task_log is enabled, allocate a buffer and open the file.
-        let mut task_log = self
-            .open_log_file(&self.task_log, "task log", 64 * 1024)
-            .await;
         // If the task_log is a CSV, write the header.
         if self.task_format == Some(GooseLogFormat::Csv) {
             if let Some(log_file) = task_log.as_mut() {
@@ -593,19 +596,19 @@ impl GooseConfiguration {
                 let formatted_message;
                 if let Some(log_file) = match message {
                     GooseLog::Debug(debug_message) => {
-                        formatted_message = self.format_message(debug_message).to_string();
+                        formatted_message = self.format_message(debug_message);
                         debug_log.as_mut()
                     }
                     GooseLog::Error(error_message) => {
-                        formatted_message = self.format_message(error_message).to_string();
+                        formatted_message = self.format_message(error_message);
                         error_log.as_mut()
                     }
                     GooseLog::Request(request_message) => {
-                        formatted_message = self.format_message(request_message).to_string();
+                        formatted_message = self.format_message(request_message);
                         request_log.as_mut()
                     }
                     GooseLog::Task(task_message) => {
-                        formatted_message = self.format_message(task_message).to_string();
+                        formatted_message = self.format_message(task_message);
                         task_log.as_mut()
                     }
                 } {
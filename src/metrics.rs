@@ -11,6 +11,7 @@
 use chrono::prelude::*;
 use http::StatusCode;
 use itertools::Itertools;
+use lazy_static::lazy_static;
 use num_format::{Locale, ToFormattedString};
 use regex::RegexSet;
 use serde::ser::SerializeStruct;
@@ -79,22 +80,28 @@ pub enum GooseCoordinatedOmissionMitigation {
     /// Completely disable coordinated omission mitigation (default).
     Disabled,
 }
+
+// Use a [`RegexSet`] to match string representations of `GooseCoordinatedOmissionMitigation`.
+// The set is compiled once and reused each time `from_str` is invoked.
+lazy_static! {
+    static ref CO_MITIGATION: RegexSet = RegexSet::new(&[
+        r"(?i)^(average|ave|aver|avg|mean)$",
+        r"(?i)^(maximum|ma|max|maxi)$",
+        r"(?i)^(minimum|mi|min|mini)$",
+        r"(?i)^(disabled|di|dis|disable|none|no)$",
+    ])
+    .expect("failed to compile co_mitigation RegexSet");
+}
+
 /// Allow `--co-mitigation` from the command line using text variations on supported
 /// `GooseCoordinatedOmissionMitigation`s by implementing [`FromStr`].
 impl FromStr for GooseCoordinatedOmissionMitigation {
     type Err = GooseError;
 
     fn from_str(s: &str) -> Result<Self, Self::Err> {
-        // Use a [`RegexSet`] to match string representations of `GooseCoordinatedOmissionMitigation`,
-        // returning the appropriate enum value. Also match a wide range of abbreviations and synonyms.
-        let co_mitigation = RegexSet::new(&[
-            r"(?i)^(average|ave|aver|avg|mean)$",
-            r"(?i)^(maximum|ma|max|maxi)$",
-            r"(?i)^(minimum|mi|min|mini)$",
-            r"(?i)^(disabled|di|dis|disable|none|no)$",
-        ])
-        .expect("failed to compile co_mitigation RegexSet");
-        let matches = co_mitigation.matches(&s);
+        // Match string representations of `GooseCoordinatedOmissionMitigation`, returning the
+        // appropriate enum value. Also match a wide range of abbreviations and synonyms.
+        let matches = CO_MITIGATION.matches(&s);
         if matches.matched(0) {
             Ok(GooseCoordinatedOmissionMitigation::Average)
         } else if matches.matched(1) {
@@ -2518,16 +2525,16 @@ impl GooseAttack {
             ));
 
             // Compile the request metrics template.
-            let mut raw_requests_rows = Vec::new();
-            for metric in raw_request_metrics {
-                raw_requests_rows.push(report::raw_request_metrics_row(metric));
-            }
+            let raw_requests_rows: Vec<String> = raw_request_metrics
+                .into_iter()
+                .map(report::raw_request_metrics_row)
+                .collect();
 
             // Compile the response metrics template.
-            let mut raw_responses_rows = Vec::new();
-            for metric in raw_response_metrics {
-                raw_responses_rows.push(report::response_metrics_row(metric));
-            }
+            let raw_responses_rows: Vec<String> = raw_response_metrics
+                .into_iter()
+                .map(report::response_metrics_row)
+                .collect();
 
             let co_requests_template: String;
             let co_responses_template: String;
@@ -2612,10 +2619,10 @@ impl GooseAttack {
                 ));
 
                 // Compile the co_request metrics rows.
-                let mut co_request_rows = Vec::new();
-                for metric in co_request_metrics {
-                    co_request_rows.push(report::coordinated_omission_request_metrics_row(metric));
-                }
+                let co_request_rows: Vec<String> = co_request_metrics
+                    .into_iter()
+                    .map(report::coordinated_omission_request_metrics_row)
+                    .collect();
 
                 // Compile the status_code metrics template.
                 co_requests_template = report::coordinated_omission_request_metrics_template(
@@ -2623,11 +2630,10 @@ impl GooseAttack {
                 );
 
                 // Compile the co_request metrics rows.
-                let mut co_response_rows = Vec::new();
-                for metric in co_response_metrics {
-                    co_response_rows
-                        .push(report::coordinated_omission_response_metrics_row(metric));
-                }
+                let co_response_rows: Vec<String> = co_response_metrics
+                    .into_iter()
+                    .map(report::coordinated_omission_response_metrics_row)
+                    .collect();
 
                 // Compile the status_code metrics template.
                 co_responses_template = report::coordinated_omission_response_metrics_template(
@@ -2722,11 +2728,11 @@ impl GooseAttack {
                     requests_per_second: format!("{:.2}", aggregate_requests_per_second),
                     failures_per_second: format!("{:.2}", aggregate_failures_per_second),
                 });
-                let mut tasks_rows = Vec::new();
                 // Compile the task metrics template.
-                for metric in task_metrics {
-                    tasks_rows.push(report::task_metrics_row(metric));
-                }
+                let tasks_rows: Vec<String> = task_metrics
+                    .into_iter()
+                    .map(report::task_metrics_row)
+                    .collect();
 
                 tasks_template = report::task_metrics_template(&tasks_rows.join("\n"));
             } else {
@@ -2736,10 +2742,12 @@ impl GooseAttack {
             // Only build the tasks template if --no-task-metrics isn't enabled.
             let errors_template: String;
             if !self.metrics.errors.is_empty() {
-                let mut error_rows = Vec::new();
-                for error in self.metrics.errors.values() {
-                    error_rows.push(report::error_row(error));
-                }
+                let error_rows: Vec<String> = self
+                    .metrics
+                    .errors
+                    .values()
+                    .map(report::error_row)
+                    .collect();
                 errors_template = report::errors_template(&error_rows.join("\n"));
             } else {
                 errors_template = "".to_string();
@@ -2785,10 +2793,10 @@ impl GooseAttack {
                 });
 
                 // Compile the status_code metrics rows.
-                let mut status_code_rows = Vec::new();
-                for metric in status_code_metrics {
-                    status_code_rows.push(report::status_code_metrics_row(metric));
-                }
+                let status_code_rows: Vec<String> = status_code_metrics
+                    .into_iter()
+                    .map(report::status_code_metrics_row)
+                    .collect();
 
                 // Compile the status_code metrics template.
                 status_code_template =
@@ -2935,22 +2943,15 @@ pub(crate) fn prepare_status_codes(
     status_code_counts: &HashMap<u16, usize>,
     aggregate_counts: &mut Option<&mut HashMap<u16, usize>>,
 ) -> String {
-    let mut codes: String = "".to_string();
+    // Collect each formatted status code and join them once at the end, rather than
+    // reallocating and copying a growing string for every status code.
+    let mut codes = Vec::with_capacity(status_code_counts.len());
     for (status_code, count) in status_code_counts {
-        if codes.is_empty() {
-            codes = format!(
-                "{} [{}]",
-                count.to_formatted_string(&Locale::en),
-                status_code
-            );
-        } else {
-            codes = format!(
-                "{}, {} [{}]",
-                codes.clone(),
-                count.to_formatted_string(&Locale::en),
-                status_code
-            );
-        }
+        codes.push(format!(
+            "{} [{}]",
+            count.to_formatted_string(&Locale::en),
+            status_code
+        ));
         if let Some(aggregate_status_code_counts) = aggregate_counts.as_mut() {
             let new_count;
             if let Some(existing_status_code_count) = aggregate_status_code_counts.get(&status_code)
@@ -2962,7 +2963,7 @@ pub(crate) fn prepare_status_codes(
             aggregate_status_code_counts.insert(*status_code, new_count);
         }
     }
-    codes
+    codes.join(", ")
 }
 
 #[cfg(test)]
@@ -3062,6 +3063,40 @@ mod test {
         assert!((fails_per_second - 1.0).abs() < f32::EPSILON);
     }
 
+    #[test]
+    fn status_codes() {
+        let mut status_code_counts: HashMap<u16, usize> = HashMap::new();
+        let mut aggregated_status_code_counts: HashMap<u16, usize> = HashMap::new();
+        // No status codes returns an empty string.
+        let codes = prepare_status_codes(
+            &status_code_counts,
+            &mut Some(&mut aggregated_status_code_counts),
+        );
+        assert_eq!(codes, "");
+        assert!(aggregated_status_code_counts.is_empty());
+
+        // A single status code is formatted without a separator.
+        status_code_counts.insert(200, 1234);
+        let codes = prepare_status_codes(
+            &status_code_counts,
+            &mut Some(&mut aggregated_status_code_counts),
+        );
+        assert_eq!(codes, "1,234 [200]");
+        assert_eq!(aggregated_status_code_counts.get(&200), Some(&1234));
+
+        // Multiple status codes are comma separated, and aggregate counts accumulate.
+        status_code_counts.insert(404, 2);
+        let codes = prepare_status_codes(
+            &status_code_counts,
+            &mut Some(&mut aggregated_status_code_counts),
+        );
+        assert_eq!(codes.split(", ").count(), 2);
+        assert!(codes.contains("1,234 [200]"));
+        assert!(codes.contains("2 [404]"));
+        assert_eq!(aggregated_status_code_counts.get(&200), Some(&2468));
+        assert_eq!(aggregated_status_code_counts.get(&404), Some(&2));
+    }
+
     #[test]
     fn goose_raw_request() {
         const PATH: &str = "http://127.0.0.1/";
@@ -194,7 +194,7 @@ async fn invoke_task_function(
     }
 
     // Otherwise send metrics to parent.
-    if let Some(parent) = thread_user.channel_to_parent.clone() {
+    if let Some(parent) = thread_user.channel_to_parent.as_ref() {
         // Best effort metrics.
         let _ = parent.send(GooseMetric::Task(raw_task));
     }
@@ -1,5 +1,6 @@
 //! Utility functions used by Goose, and available when writing load tests.
 
+use lazy_static::lazy_static;
 use regex::Regex;
 use std::cmp::{max, min};
 use std::collections::BTreeMap;
@@ -11,6 +12,13 @@ use url::Url;
 
 use crate::GooseError;
 
+// Regular expression used by `parse_timespan` to extract hours, minutes and seconds, compiled
+// once and reused.
+lazy_static! {
+    static ref TIMESPAN: Regex =
+        Regex::new(r"((?P<hours>\d+?)h)?((?P<minutes>\d+?)m)?((?P<seconds>\d+?)s)?").unwrap();
+}
+
 /// Parse a string representing a time span and return the number of seconds.
 ///
 /// Can be specified as an integer, indicating seconds. Or can use integers
@@ -41,9 +49,7 @@ pub fn parse_timespan(time_str: &str) -> usize {
         }
         // Otherwise use a regex to extract hours, minutes and seconds from string.
         Err(_) => {
-            let re = Regex::new(r"((?P<hours>\d+?)h)?((?P<minutes>\d+?)m)?((?P<seconds>\d+?)s)?")
-                .unwrap();
-            let time_matches = re.captures(time_str).unwrap();
+            let time_matches = TIMESPAN.captures(time_str).unwrap();
             let hours = match time_matches.name("hours") {
                 Some(_) => usize::from_str(&time_matches["hours"]).unwrap(),
                 None => 0,